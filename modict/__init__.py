@@ -16,6 +16,7 @@ from ._typechecker import (
     TypeCheckFailureError,
     TypeMismatchError,
     check_type,
+    compile_check,
     coerce,
     can_coerce,
     typechecked,
@@ -47,6 +48,7 @@ __all__ = [
     "MISSING",
     "TypeCache",
     "check_type",
+    "compile_check",
     "coerce",
     "can_coerce",
     "typechecked",
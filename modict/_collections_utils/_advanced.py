@@ -458,7 +458,14 @@ def unwalk(walked: Dict[Path, Any], ignore_types: bool = False) -> MutableContai
     return base
 
 def deep_equals(obj1: Container, obj2: Container, excluded: Optional[Tuple[Type, ...]] = None) -> bool:
-    """Compare two nested structures deeply by comparing their walked dicts.
+    """Compare two nested structures deeply, node by node.
+
+    Walks both structures side by side with an explicit stack and returns as
+    soon as a mismatch is found. Mappings are compared by keys (any Mapping
+    class matches any other), sequences by length and position (a list matches
+    a tuple), and leaves with ``==``. Empty containers are significant, so
+    ``{'a': {}}`` does not equal ``{}``. A pair of containers already being
+    compared is not compared again, so cyclic structures terminate.
 
     Args:
         obj1: First container to compare
@@ -474,7 +481,39 @@ def deep_equals(obj1: Container, obj2: Container, excluded: Optional[Tuple[Type,
         >>> deep_equals({'a': [1, 2]}, {'a': [1, 3]})
         False
     """
-    return walked(obj1, excluded=excluded) == walked(obj2, excluded=excluded)
+    excluded = excluded if excluded is not None else (str, bytes, bytearray)
+    stack = [(obj1, obj2)]
+    # Container pairs already compared, by ids. The pairs are kept alive so that their
+    # ids can't be recycled by temporaries (e.g. computed values) during the walk.
+    compared = {}
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+        if is_container(a, excluded=excluded):
+            pair = (id(a), id(b))
+            if pair in compared:
+                continue
+            compared[pair] = (a, b)
+        if isinstance(a, Mapping) and not isinstance(a, excluded):
+            if not isinstance(b, Mapping) or isinstance(b, excluded) or len(a) != len(b):
+                return False
+            for key in a:
+                if key not in b:
+                    return False
+                stack.append((a[key], b[key]))
+        elif isinstance(a, Sequence) and not isinstance(a, excluded):
+            if (
+                isinstance(b, Mapping)
+                or not isinstance(b, Sequence)
+                or isinstance(b, excluded)
+                or len(a) != len(b)
+            ):
+                return False
+            stack.extend(zip(a, b))
+        elif is_container(b, excluded=excluded) or a != b:
+            return False
+    return True
 
 def diff_nested(
     obj1: Container,
@@ -552,7 +591,9 @@ def diff_nested(
 def deep_merge(target, src, conflict_resolver: Optional[Callable[[Any, Any], Any]] = None):
     """Deeply merge src into target, modifying target in-place.
 
-    For mappings, merges recursively. For sequences, extends or replaces based on index.
+    For mappings, merges nested containers key by key. For sequences, extends or replaces
+    based on index. Nested pairs are processed from a work-queue, so depth isn't limited
+    by the recursion limit.
     Conflicts can be resolved via an optional callback.
 
     If src has a value of MISSING for a key/index, that key/index is removed from target.
@@ -575,49 +616,53 @@ def deep_merge(target, src, conflict_resolver: Optional[Callable[[Any, Any], Any
         >>> target
         {'a': 1, 'c': 3, 'd': 4}
     """
-    if isinstance(target, MutableMapping) and isinstance(src, Mapping):
-        # Collect keys to delete first to avoid modifying dict during iteration
-        keys_to_delete = []
-
-        for key, src_value in src.items():
-            if src_value is MISSING:
-                # Mark key for deletion
-                if has_key(target, key):
-                    keys_to_delete.append(key)
-            elif has_key(target, key):
-                target_value = target[key]
-                if is_container(target_value) and is_container(src_value):
-                    deep_merge(target_value, src_value, conflict_resolver)
+    # Flat work-queue of (target, src) container pairs instead of recursion
+    stack = [(target, src)]
+    while stack:
+        target, src = stack.pop()
+        if isinstance(target, MutableMapping) and isinstance(src, Mapping):
+            # Collect keys to delete first to avoid modifying dict during iteration
+            keys_to_delete = []
+
+            for key, src_value in src.items():
+                if src_value is MISSING:
+                    # Mark key for deletion
+                    if key in target:
+                        keys_to_delete.append(key)
+                elif key in target:
+                    target_value = target[key]
+                    if is_container(target_value) and is_container(src_value):
+                        stack.append((target_value, src_value))
+                    else:
+                        target[key] = conflict_resolver(target_value, src_value) if conflict_resolver else src_value
                 else:
-                    target[key] = conflict_resolver(target_value, src_value) if conflict_resolver else src_value
-            else:
-                target[key] = src_value
-
-        # Delete marked keys
-        for key in keys_to_delete:
-            del target[key]
-
-    elif isinstance(target, MutableSequence) and isinstance(src, Sequence):
-        # For sequences, we need to handle deletions carefully
-        # We collect indices to delete and process them in reverse order
-        indices_to_delete = []
-
-        for idx, src_value in enumerate(src):
-            if src_value is MISSING:
-                # Mark index for deletion
-                if idx < len(target):
-                    indices_to_delete.append(idx)
-            elif idx < len(target):
-                target_value = target[idx]
-                if is_container(target_value) and is_container(src_value):
-                    deep_merge(target_value, src_value, conflict_resolver)
+                    target[key] = src_value
+
+            # Delete marked keys
+            for key in keys_to_delete:
+                del target[key]
+
+        elif isinstance(target, MutableSequence) and isinstance(src, Sequence):
+            # For sequences, we need to handle deletions carefully
+            # We collect indices to delete and process them in reverse order
+            indices_to_delete = []
+
+            for idx, src_value in enumerate(src):
+                if src_value is MISSING:
+                    # Mark index for deletion
+                    if idx < len(target):
+                        indices_to_delete.append(idx)
+                elif idx < len(target):
+                    target_value = target[idx]
+                    if is_container(target_value) and is_container(src_value):
+                        stack.append((target_value, src_value))
+                    else:
+                        target[idx] = conflict_resolver(target_value, src_value) if conflict_resolver else src_value
                 else:
-                    target[idx] = conflict_resolver(target_value, src_value) if conflict_resolver else src_value
-            else:
-                target.append(src_value)
+                    target.append(src_value)
 
-        # Delete indices in reverse order to maintain index validity
-        for idx in sorted(indices_to_delete, reverse=True):
-            del target[idx]
-    else:
-        raise TypeError("Types of 'target' and 'src' aren't compatibles for deep merging.")
+            # Delete indices in reverse order to maintain index validity
+            for idx in sorted(indices_to_delete, reverse=True):
+                del target[idx]
+        else:
+            raise TypeError("Types of 'target' and 'src' aren't compatibles for deep merging.")
@@ -10,6 +10,8 @@ See RFC 9535: https://datatracker.ietf.org/doc/html/rfc9535
 """
 
 from dataclasses import dataclass
+import sys
+from functools import lru_cache
 from typing import Tuple, Union, Optional, Any, Iterator, Iterable, List, Callable, Type, Dict
 from jsonpath_ng import parse as jsonpath_parse
 from jsonpath_ng.jsonpath import Index, Fields, Root, Child
@@ -137,6 +139,68 @@ class PathKey:
             return True
         return False
 
+@lru_cache(maxsize=4096)
+def _parse_jsonpath_components(jsonpath: str) -> Tuple[PathKey, ...]:
+    """Parse a JSONPath string into PathKey components (see Path.from_jsonpath).
+
+    Results are memoized, so code accessing the same paths repeatedly doesn't
+    pay for jsonpath-ng parsing each time. Invalid paths raise and aren't cached.
+    Field names are interned, like the keys stored by modict.__setitem__.
+    """
+    # Legacy detection
+    if not jsonpath.startswith("$"):
+        raise ValueError(
+            f"Legacy dot-notation detected: {jsonpath!r}\n"
+            f"modict 0.2.0+ requires JSONPath (RFC 9535).\n"
+            f"Examples:\n"
+            f"  'a.0.b'   → '$.a[0].b'\n"
+            f"  'a.b.c'   → '$.a.b.c'\n"
+            f"See: https://github.com/B4PT0R/modict/blob/main/MIGRATION.md"
+        )
+
+    # Parse using jsonpath-ng
+    try:
+        parsed = jsonpath_parse(jsonpath)
+    except Exception as e:
+        raise ValueError(f"Invalid JSONPath syntax: {jsonpath!r}\n{e}")
+
+    # Extract components from parsed JSONPath
+    components = []
+
+    # Walk the JSONPath tree to extract components
+    def extract_components(node, components_list):
+        """Recursively extract components from jsonpath-ng AST."""
+        if isinstance(node, Root):
+            # Root node ($), skip
+            return
+        elif isinstance(node, Child):
+            # Child node (e.g., $.a.b), recurse on left, then process right
+            extract_components(node.left, components_list)
+            extract_components(node.right, components_list)
+        elif isinstance(node, Fields):
+            # Field access (e.g., 'name' in $.name)
+            # Use dict as the default mapping type when parsing JSONPath
+            for field in node.fields:
+                components_list.append(PathKey(sys.intern(field), dict))
+        elif isinstance(node, Index):
+            # Array index (e.g., [0] or [-1])
+            # Use list as the default sequence type when parsing JSONPath
+            components_list.append(PathKey(node.index, list))
+        else:
+            # Other node types - attempt to extract fields/index if available
+            if hasattr(node, 'fields'):
+                for field in node.fields:
+                    components_list.append(PathKey(sys.intern(field), dict))
+            elif hasattr(node, 'index'):
+                components_list.append(PathKey(node.index, list))
+            else:
+                raise ValueError(f"Unsupported JSONPath component: {node!r}")
+
+    extract_components(parsed, components)
+
+    return tuple(components)
+
+
 @dataclass(frozen=True)
 class Path:
     """Parsed JSONPath with metadata.
@@ -227,60 +291,8 @@ class Path:
             Legacy dot-notation paths (e.g., 'a.0.b') will raise a ValueError
             with migration guidance.
         """
-        # Legacy detection
-        if not jsonpath.startswith("$"):
-            raise ValueError(
-                f"Legacy dot-notation detected: {jsonpath!r}\n"
-                f"modict 0.2.0+ requires JSONPath (RFC 9535).\n"
-                f"Examples:\n"
-                f"  'a.0.b'   → '$.a[0].b'\n"
-                f"  'a.b.c'   → '$.a.b.c'\n"
-                f"See: https://github.com/B4PT0R/modict/blob/main/MIGRATION.md"
-            )
-
-        # Parse using jsonpath-ng
-        try:
-            parsed = jsonpath_parse(jsonpath)
-        except Exception as e:
-            raise ValueError(f"Invalid JSONPath syntax: {jsonpath!r}\n{e}")
-
-        # Extract components from parsed JSONPath
-        components = []
-
-        # Walk the JSONPath tree to extract components
-        def extract_components(node, components_list):
-            """Recursively extract components from jsonpath-ng AST."""
-            if isinstance(node, Root):
-                # Root node ($), skip
-                return
-            elif isinstance(node, Child):
-                # Child node (e.g., $.a.b), recurse on left, then process right
-                extract_components(node.left, components_list)
-                extract_components(node.right, components_list)
-            elif isinstance(node, Fields):
-                # Field access (e.g., 'name' in $.name)
-                # Use dict as the default mapping type when parsing JSONPath
-                for field in node.fields:
-                    components_list.append(PathKey(field, dict))
-            elif isinstance(node, Index):
-                # Array index (e.g., [0] or [-1])
-                # Use list as the default sequence type when parsing JSONPath
-                components_list.append(PathKey(node.index, list))
-            else:
-                # Other node types - attempt to extract fields/index if available
-                if hasattr(node, 'fields'):
-                    for field in node.fields:
-                        components_list.append(PathKey(field, dict))
-                elif hasattr(node, 'index'):
-                    components_list.append(PathKey(node.index, list))
-                else:
-                    raise ValueError(f"Unsupported JSONPath component: {node!r}")
-
-        extract_components(parsed, components)
-
-        return Path(
-            components=tuple(components)
-        )
+        # Parsing is cached: Path objects are immutable so they can share components
+        return Path(components=_parse_jsonpath_components(jsonpath))
 
     @classmethod
     def normalize(cls, path: 'PathType') -> 'Path':
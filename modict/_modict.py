@@ -1,3 +1,4 @@
+from array import array
 from collections.abc import Mapping
 from types import ClassMethodDescriptorType
 from typing import Optional, Union, Tuple, Set, Dict, List, Any, Callable, Type
@@ -26,11 +27,50 @@ from ._collections_utils import (
     Path,
 )
 import copy
+import contextlib
 import json
+import math
+import sys
 import importlib
 from typing import Literal
 from collections.abc import MutableMapping, MutableSequence
 
+
+# Scalar types json.dumps encodes natively (matched by exact type in _is_json)
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def _is_json(value, allow_nan: bool = True) -> bool:
+    """Fast check that a value only contains JSON-native types, without encoding it.
+
+    Returns False when unsure (other types or subclasses, non-str keys, non-finite floats
+    when not allowed, shared or circular references), in which case callers should fall
+    back to an actual json.dumps() to decide.
+    """
+    stack = [value]
+    seen = set()
+    while stack:
+        node = stack.pop()
+        t = type(node)
+        if t in _JSON_SCALARS:
+            if t is float and not allow_nan and not math.isfinite(node):
+                return False
+            continue
+        if id(node) in seen:
+            return False
+        seen.add(id(node))
+        if t is dict or t is modict:
+            for k, v in dict.items(node):
+                if type(k) is not str:
+                    return False
+                stack.append(v)
+        elif t is list or t is tuple:
+            stack.extend(node)
+        else:
+            return False
+    return True
+
+
 class modict(dict, metaclass=modictMeta):
     """A dict with additional capabilities.
 
@@ -64,6 +104,11 @@ class modict(dict, metaclass=modictMeta):
         $.a[0].d: 3
     """
 
+    # Per-instance version counters validating computed caches (allocated on first use, see _versions)
+    __versions__ = None
+    # Keys changed inside _batched(), whose invalidation is deferred
+    __pending_invalidation__ = None
+
     @classmethod
     def factory(cls, default_factory: Callable):
         """Create a factory for default values.
@@ -195,7 +240,7 @@ class modict(dict, metaclass=modictMeta):
             return func
 
     @classmethod
-    def computed(cls, func=None, *, cache=False, deps=None):
+    def computed(cls, func=None, *, cache=False, deps=None, jit=False):
         """Create computed properties or decorate methods as computed.
 
         Args:
@@ -206,6 +251,10 @@ class modict(dict, metaclass=modictMeta):
                 - Other computed field names: ['other_computed']
                 - None (default): invalidate on any change
                 - []: never invalidate automatically
+            jit: Compile the function with Numba (optional dependency) on first use.
+                The function then receives the values of deps as positional arguments
+                instead of the instance, so deps must be given. Falls back to plain
+                Python when Numba is not installed or can't compile the function.
 
         Returns:
             Either a Computed instance or a decorator function
@@ -252,6 +301,12 @@ class modict(dict, metaclass=modictMeta):
 
                 calc.a = 10  # Change 'a' -> sum_ab invalid -> final_result invalid automatically
                 print(calc.final_result)  # "Calculating sum_ab", "Calculating final_result", prints 15
+
+            Numeric computed compiled with Numba::
+
+                @modict.computed(cache=True, deps=['a', 'b'], jit=True)
+                def hypot(a, b):
+                    return (a * a + b * b) ** 0.5
         """
         if func is None:
             # Called as decorator: @modict.computed() or @modict.computed(cache=True, deps=['a'])
@@ -259,11 +314,12 @@ class modict(dict, metaclass=modictMeta):
                 f._is_computed = True
                 f._computed_cache = cache
                 f._computed_deps = deps
+                f._computed_jit = jit
                 return f
             return decorator
         else:
             # Called as function: modict.computed(lambda m: m.a + m.b, cache=True, deps=['a', 'b'])
-            return Computed(func, cache=cache, deps=deps)
+            return Computed(func, cache=cache, deps=deps, jit=jit)
 
     @classmethod
     def from_model(cls, pydantic_class, *, name=None, strict=None, coerce=None, **config_kwargs):
@@ -562,23 +618,8 @@ class modict(dict, metaclass=modictMeta):
 
         super().__init__(*args,**kwargs)
 
-        # Inject defaults and computed
-        for key, field in self.__fields__.items():
-            value=field.get_default()
-            if value is not MISSING:
-                if isinstance(value, Computed):
-                    if key in self:
-                        if not getattr(self._config, "override_computed", False):
-                            raise TypeError(
-                                f"Cannot override computed field '{key}' at initialization "
-                                f"(override_computed=False)"
-                            )
-                        # override_computed=True: keep user-provided value
-                    else:
-                        dict.__setitem__(self, key, value)
-                else:
-                    if key not in self:
-                        dict.__setitem__(self, key, value)
+        # Inject defaults and computed (per-class generated code, see modictMeta)
+        self.__inject_defaults__()
 
         # Enforce key-level constraints (required/extra/require_all) independently of value checking.
         if self._check_keys_enabled():
@@ -590,6 +631,21 @@ class modict(dict, metaclass=modictMeta):
 
     def _check_keys_enabled(self) -> bool:
         """Return True if modict should enforce key-level structural constraints."""
+        enabled = self._check_keys_declared()
+        if enabled is None:
+            # Also enable key checks as soon as the instance contains computed fields.
+            # This preserves the default "computed override protection" even for plain `modict`
+            # instances where computeds are inserted dynamically at runtime.
+            return any(isinstance(v, Computed) for v in dict.values(self))
+        return enabled
+
+    def _check_keys_declared(self) -> Optional[bool]:
+        """Return whether key-level checks are enabled by the config or the class declarations.
+
+        Returns None when that depends on the instance containing computed values (auto mode
+        without declared key constraints), which single-key operations can decide on their own
+        without scanning the instance.
+        """
         mode = getattr(self._config, "check_keys", "auto")
         if mode is True:
             return True
@@ -597,21 +653,10 @@ class modict(dict, metaclass=modictMeta):
             return False
 
         # auto: enable when the instance/class declares key constraints
-        fields = getattr(self, "__fields__", {}) or {}
-        has_required = any(bool(getattr(f, "required", False)) for f in fields.values())
-        has_computed = any(isinstance(getattr(f, "default", None), Computed) for f in fields.values())
-        # Also enable key checks as soon as the instance contains computed fields.
-        # This preserves the default "computed override protection" even for plain `modict`
-        # instances where computeds are inserted dynamically at runtime.
-        has_runtime_computed = any(isinstance(v, Computed) for v in dict.values(self))
-        wants_key_processing = bool(
-            self._config.require_all
-            or self._config.extra != "allow"
-            or has_required
-            or has_computed
-            or has_runtime_computed
-        )
-        return wants_key_processing
+        # (required or computed fields, summarized by modictMeta)
+        if self._config.require_all or self._config.extra != "allow" or self.__has_key_constraints__:
+            return True
+        return None
 
     def _enforce_extra_policy(self) -> None:
         """Enforce extra key policy (allow/forbid/ignore)."""
@@ -710,29 +755,22 @@ class modict(dict, metaclass=modictMeta):
             return False
 
         # auto: enable when the class looks "model-like"
-        has_hints = any(
-            (field.hint is not None)
-            for field in getattr(self, "__fields__", {}).values()
-        )
-        has_validators = any(
-            bool(getattr(field, "validators", []))
-            for field in getattr(self, "__fields__", {}).values()
-        )
-        has_model_validators = bool(getattr(self, "__model_validators__", ()))
-        wants_value_processing = any(
-            (
-                self._config.enforce_json,
-                self._config.str_strip_whitespace,
-                self._config.str_to_lower,
-                self._config.str_to_upper,
-                self._config.use_enum_values,
-                self._config.validate_assignment,
-                self._config.strict,
-            )
+        # (hints, validators or model validators, summarized by modictMeta)
+        if self.__has_value_constraints__:
+            return True
+        config = self._config
+        wants_value_processing = (
+            config.enforce_json
+            or config.str_strip_whitespace
+            or config.str_to_lower
+            or config.str_to_upper
+            or config.use_enum_values
+            or config.validate_assignment
+            or config.strict
         )
-        wants_key_processing = (self._config.extra != "allow")
+        wants_key_processing = (config.extra != "allow")
 
-        return bool(has_hints or has_validators or has_model_validators or wants_value_processing or wants_key_processing)
+        return bool(wants_value_processing or wants_key_processing)
 
     def _run_model_validators(self, *, mode: Literal["before", "after"]) -> None:
         """Run model-level validators for a given phase."""
@@ -796,22 +834,24 @@ class modict(dict, metaclass=modictMeta):
             value = self._coerce_value(key, value, hint)
 
         # 4. Type checking ensuite (validation stricte du résultat)
+        checker = None
         if hint is None:
             # Récupérer le hint du Field si pas fourni
             field = self.__fields__.get(key)
             if field and field.hint is not None:
                 hint = field.hint
+                checker = self.__checkers__.get(key)
 
         # Vérifier le type si on a un hint (Pydantic-like: always, strict controls coercion)
         if hint is not None:
-            self._check_type(key, value, hint)
+            self._check_type(key, value, hint, checker)
 
         # 5. Apply validators "after" (Pydantic-like)
         value = self._apply_validators(key, value, mode="after")
 
         # Re-check type after post-validators (they may transform values)
         if hint is not None:
-            self._check_type(key, value, hint)
+            self._check_type(key, value, hint, checker)
 
         # 6. Apply JSON-Schema-like constraints from Field.metadata (when present)
         self._apply_constraints(key, value)
@@ -976,16 +1016,21 @@ class modict(dict, metaclass=modictMeta):
         Returns:
             The coerced value, or original value if coercion fails
         """
+        checker = None
         if hint is None:
             field = self.__fields__.get(key)
             if field and field.hint is not None:
                 hint = field.hint
+                checker = self.__checkers__.get(key)
             else:
                 return value  # No hint, no coercion
         
         # Si la valeur correspond déjà au type, pas de coercion
         try:
-            check_type(hint, value)
+            if checker is not None:
+                checker(value)
+            else:
+                check_type(hint, value)
             return value
         except Exception:
             pass  # Type check a échoué, on tente la coercion
@@ -1006,6 +1051,11 @@ class modict(dict, metaclass=modictMeta):
         Raises:
             ValueError: If the value is not JSON serializable
         """
+        allow_nan = bool(getattr(self._config, "allow_inf_nan", True))
+        if _is_json(value, allow_nan):
+            # Only JSON-native values: no need to actually encode them
+            return
+
         encoders = getattr(self._config, "json_encoders", None) or {}
 
         def _default(o):
@@ -1019,7 +1069,7 @@ class modict(dict, metaclass=modictMeta):
             # Test de sérialisation rapide
             json.dumps(
                 value,
-                allow_nan=bool(getattr(self._config, "allow_inf_nan", True)),
+                allow_nan=allow_nan,
                 default=_default if encoders else None,
             )
         except (TypeError, ValueError, OverflowError) as e:                
@@ -1027,7 +1077,7 @@ class modict(dict, metaclass=modictMeta):
                 f"Field '{key}' contains non-JSON-serializable value: {type(value).__name__}"
             ) from e
 
-    def _check_type(self,key,value,hint):
+    def _check_type(self,key,value,hint,checker=None):
         # Pydantic-like behavior: when use_enum_values=True, allow Enum fields
         # to hold their underlying .value (e.g. Color.RED -> "red").
         if getattr(self._config, "use_enum_values", False) and isinstance(hint, type):
@@ -1041,36 +1091,143 @@ class modict(dict, metaclass=modictMeta):
             except Exception:
                 pass
         try:
-            check_type(hint, value)
+            if checker is not None:
+                # compiled check of the field hint (see modictMeta)
+                checker(value)
+            else:
+                check_type(hint, value)
             return True
         except TypeMismatchError as e:
             raise TypeError(f"Key {key!r} expected {hint}, got {type(value)}") from e
             
-    def _invalidate_dependants(self, changed_keys: set):
-        """Recursively invalidate computed properties that depend on the given keys.
+    def _versions(self) -> array:
+        """Return the version counters of this instance, allocating them on first use.
 
-        Handles cascading dependencies automatically in a single method.
+        Slot 0 is bumped on every change, the other slots track one key each, as mapped
+        by __version_slots__ (declared fields, then keys referenced as dependencies).
+        """
+        versions = self.__versions__
+        if versions is None:
+            versions = array('Q', bytes(8 * (len(self.__version_slots__) + 1)))
+            object.__setattr__(self, '__versions__', versions)
+        return versions
+
+    def _version_slot(self, key) -> int:
+        """Return the version slot of a key, allocating one if the key has none yet."""
+        slots = self.__version_slots__
+        slot = slots.get(key)
+        if slot is None:
+            versions = self._versions()
+            if '__version_slots__' not in self.__dict__:
+                # The class-level mapping is shared: extend a copy owned by the instance
+                slots = dict(slots)
+                object.__setattr__(self, '__version_slots__', slots)
+            slot = len(versions)
+            slots[key] = slot
+            versions.append(0)
+        return slot
+
+    def _computed_stamp(self, computed: Computed, _visiting=None) -> tuple:
+        """Return the current versions of everything a computed depends on.
+
+        A cached computed stores this stamp along with its value and reuses the value
+        as long as the stamp is unchanged. Dependencies that are themselves computed
+        contribute their own stamp, so changes propagate through chains of computeds.
 
         Args:
-            changed_keys: Set of keys that have changed (initially the modified key,
-                then computed names that got invalidated)
+            computed: The Computed object to stamp
+            _visiting: Internal set of computed ids being stamped (cycle guard)
+        """
+        if self.__pending_invalidation__:
+            self._flush_invalidation()
+        versions = self._versions()
+        deps = computed.deps
+        if deps is None:
+            return (versions[0],)  # depends on any change
+        plan = computed._stamp_plan
+        if plan is not None and plan[0] is type(self) and self._matches_stamp_layout(plan[2]):
+            # Dependency graph flattened at class creation, still matching this instance
+            return tuple([versions[slot] for slot in plan[1]])
+        stamp = []
+        for dep in deps:
+            stamp.append(versions[self._version_slot(dep)])
+            raw = dict.get(self, dep, MISSING)
+            if isinstance(raw, Computed):
+                if _visiting is None:
+                    _visiting = {id(computed)}
+                if id(raw) not in _visiting:
+                    _visiting.add(id(raw))
+                    stamp.extend(self._computed_stamp(raw, _visiting))
+        return tuple(stamp)
+
+    def _matches_stamp_layout(self, layout) -> bool:
+        """Return True if the computeds stored at the keys of a flattened dependency graph
+        are still the declared ones (see compute_stamp_plans).
+
+        Any write path (including dict.update) may have stored another computed there, whose
+        own dependencies the flattened graph doesn't know about. Declared computeds replaced
+        by plain values are fine: the graph then only covers more keys than needed.
         """
-        if not changed_keys:
+        for key, declared in layout:
+            raw = dict.get(self, key)
+            if isinstance(raw, Computed):
+                if declared is None or raw.deps != declared.deps:
+                    return False
+        return True
+
+    def _invalidate_dependants(self, changed_keys):
+        """Invalidate cached computed values depending on the given keys.
+
+        Nothing is walked here: the version counters of the keys are bumped, and cached
+        computeds notice the change when their stamp no longer matches (see _computed_stamp).
+        This also cascades to computeds depending on other computeds.
+
+        Inside _batched(), the keys are only recorded and invalidated once at the end.
+
+        Args:
+            changed_keys: Iterable of keys that have changed
+        """
+        pending = self.__pending_invalidation__
+        if pending is not None:
+            pending.update(changed_keys)
             return
-            
-        newly_invalidated = set()
-        
-        # Trouver tous les computed qui dépendent des clés modifiées
-        for field_name, value in dict.items(self):
-            if isinstance(value, Computed):
-                if value.should_invalidate_for_keys(changed_keys):
-                    if value.cache and value._cache_valid:  # Seulement si effectivement en cache
-                        value.invalidate_cache()
-                        newly_invalidated.add(field_name)
-        
-        # Récursion : propager aux computed qui dépendent des computed qu'on vient d'invalider
-        if newly_invalidated:
-            self._invalidate_dependants(newly_invalidated)
+        versions = self._versions()
+        versions[0] += 1
+        slots = self.__version_slots__
+        for key in changed_keys:
+            slot = slots.get(key)
+            if slot is not None:
+                versions[slot] += 1
+
+    def _flush_invalidation(self):
+        """Invalidate the keys recorded so far by the current _batched() block."""
+        pending = self.__pending_invalidation__
+        if pending:
+            object.__setattr__(self, '__pending_invalidation__', None)
+            try:
+                self._invalidate_dependants(pending)
+            finally:
+                object.__setattr__(self, '__pending_invalidation__', set())
+
+    @contextlib.contextmanager
+    def _batched(self):
+        """Group writes so that computed caches are invalidated once for all of them.
+
+        Changed keys are collected during the block and invalidated on exit. A computed
+        read inside the block flushes the pending keys first, so it never sees stale
+        values. Nested blocks join the outermost one.
+        """
+        if self.__pending_invalidation__ is not None:
+            yield
+            return
+        object.__setattr__(self, '__pending_invalidation__', set())
+        try:
+            yield
+        finally:
+            pending = self.__pending_invalidation__
+            object.__setattr__(self, '__pending_invalidation__', None)
+            if pending:
+                self._invalidate_dependants(pending)
 
     def _invalidate_all(self):
         for value in dict.values(self):
@@ -1177,14 +1334,22 @@ class modict(dict, metaclass=modictMeta):
                 f"Set frozen=False in config to allow modifications."
             )
 
+        # Intern string keys (often built at runtime, e.g. parsed from JSON) so that later
+        # lookups with identifier keys (attribute access, field names) match by identity
+        if type(key) is str:
+            key = sys.intern(key)
+
+        # Key-level constraints are controlled by check_keys. When only runtime computeds would
+        # enable them (check_keys is None), the stored value of this key is all that matters.
+        check_keys = self._check_keys_declared()
+
         # Prevent accidental overwrites of computed fields unless explicitly allowed.
-        # This is a key-level constraint, controlled by check_keys.
-        if self._check_keys_enabled() and not isinstance(value, Computed):
+        if check_keys is not False and not isinstance(value, Computed):
             existing = dict.get(self, key, MISSING)
             if isinstance(existing, Computed) and not getattr(self._config, "override_computed", False):
                 raise TypeError(f"Cannot override computed field '{key}' (override_computed=False)")
 
-        if self._check_keys_enabled():
+        if check_keys:
             # Handle extra keys based on config
             if key not in self.__fields__:
                 if self._config.extra == 'forbid':
@@ -1206,7 +1371,7 @@ class modict(dict, metaclass=modictMeta):
         if self._check_values_enabled() and self._config.validate_assignment:
             value = self._check_value(key, value)
         dict.__setitem__(self, key, value)
-        self._invalidate_dependants({key})
+        self._invalidate_dependants((key,))
 
     def __delitem__(self, key):
         # Check if frozen
@@ -1215,7 +1380,7 @@ class modict(dict, metaclass=modictMeta):
                 f"Cannot delete field '{key}': instance is frozen (immutable). "
                 f"Set frozen=False in config to allow modifications."
             )
-        if self._check_keys_enabled():
+        if self._check_keys_declared() is not False:
             # If require_all=True, declared fields must always be present.
             if bool(getattr(self._config, "require_all", False)) and key in getattr(self, "__fields__", {}):
                 raise TypeError(f"Cannot delete declared field '{key}' (require_all=True)")
@@ -1224,7 +1389,7 @@ class modict(dict, metaclass=modictMeta):
                 raise TypeError(f"Cannot delete computed field '{key}' (override_computed=False)")
         # On laisse remonter le KeyError si pas de clé
         dict.__delitem__(self, key)
-        self._invalidate_dependants({key})
+        self._invalidate_dependants((key,))
 
     def __repr__(self):
         content=', '.join(f"{k!r}: {v!r}" for k,v in self.items())
@@ -1389,12 +1554,11 @@ class modict(dict, metaclass=modictMeta):
         Raises:
             AttributeError: If the attribute/key doesn't exist
         """
-        if hasattr(type(self), key):
-            return super().__getattribute__(key)
-        elif key in self:
+        # Only reached when the regular lookup failed: try the keys first, unless a class
+        # attribute (e.g. a property raising AttributeError) takes precedence.
+        if key in self and not hasattr(type(self), key):
             return self[key]
-        else:
-            return super().__getattribute__(key)
+        return super().__getattribute__(key)
 
     def __setattr__(self, key, value):
         """Allow attribute-style setting of dictionary keys.
@@ -1406,7 +1570,10 @@ class modict(dict, metaclass=modictMeta):
             key: The attribute/key name
             value: The value to set
         """
-        if hasattr(type(self), key):
+        if key in self.__field_accessors__:
+            # Declared field (see FieldAccessor) → dict behavior
+            self[key] = value
+        elif hasattr(type(self), key):
             object.__setattr__(self, key, value)
         else:
             # New key → dict behavior
@@ -1442,10 +1609,14 @@ class modict(dict, metaclass=modictMeta):
         Takes any object as input and converts nested dictionaries to modicts.
         Handles circular references gracefully.
 
+        The traversal uses an explicit work stack rather than Python recursion,
+        so arbitrarily deep structures don't hit the interpreter recursion limit.
+
         Args:
             obj: The object to convert
-            seen: Internal dict for tracking circular references (used in recursion)
-            root: Whether this is the root call (affects which class is used)
+            seen: Internal dict mapping input object ids to converted values
+                (used to handle circular and shared references)
+            root: Whether obj is the root of the conversion (affects which class is used)
             recurse: If False, stop recursion when reaching a modict node
                 (either an existing modict or a dict that gets converted to a modict).
                 This is useful for lazy auto-conversion: nested modicts will convert
@@ -1467,35 +1638,60 @@ class modict(dict, metaclass=modictMeta):
         """
         if seen is None:
             seen = {}  # Map object id -> converted value
-
-        obj_id = id(obj)
-        if obj_id in seen:
-            return seen[obj_id]
-
-        # if dict we upgrade to modict first
-        if isinstance(obj, dict) and not isinstance(obj, modict):
-            if root:
-                obj = cls(obj)
+        # Keep input nodes alive while converting, so their ids can't be recycled
+        # by containers allocated during the walk and produce false `seen` hits.
+        inputs = []
+
+        def upgrade(node, is_root):
+            """Return (converted node, whether its children must be visited)."""
+            node_id = id(node)
+            if node_id in seen:
+                return seen[node_id], False
+            inputs.append(node)
+
+            # if dict we upgrade to modict first
+            if isinstance(node, dict) and not isinstance(node, modict):
+                node = cls(node) if is_root else modict(node)
+
+            # Register the new instance as output for an already seen input
+            seen[node_id] = node
+
+            # If recursion is disabled, stop at modict nodes (existing or newly converted)
+            if not recurse and isinstance(node, modict):
+                return node, False
+            return node, is_mutable_container(node)
+
+        result, expand = upgrade(obj, root)
+        stack = [result] if expand else []
+        while stack:
+            node = stack.pop()
+            is_modict = isinstance(node, modict)
+            # We convert in situ to preserve references of original containers as much as possible.
+            # Since each node is upgraded before being pushed, children can be stored in their
+            # parent right away and visited later on.
+            # Children are read raw: going through __getitem__ would auto-convert them into
+            # fresh objects that `seen` can't recognize, so cycles would never end.
+            if is_modict:
+                children = list(dict.items(node))
+            elif isinstance(node, list):
+                children = list(enumerate(list.__iter__(node)))
             else:
-                obj = modict(obj)
-
-        # Register the new instance as output for an already seen input
-        seen[obj_id] = obj
-
-        # If recursion is disabled, stop at modict nodes (existing or newly converted)
-        if not recurse and isinstance(obj, modict):
-            return obj
-
-        # then we recursively convert the values
-        if is_mutable_container(obj):
-            # We convert in situ to preserve references of original containers as much as possible
-            for k, v in unroll(obj):
-                if isinstance(obj, modict):
-                    dict.__setitem__(obj, k, cls.convert(v, seen, root=False, recurse=recurse))
-                else:
-                    obj[k] = cls.convert(v, seen, root=False, recurse=recurse)
+                children = list(unroll(node))
+            for k, v in children:
+                if not recurse and isinstance(v, modict):
+                    continue  # kept as is and not visited, see upgrade()
+                new, expand = upgrade(v, False)
+                if new is not v:
+                    # Only write back upgraded children: containers read repeatedly
+                    # (auto_convert) are then walked without being rewritten
+                    if is_modict:
+                        dict.__setitem__(node, k, new)
+                    else:
+                        node[k] = new
+                if expand:
+                    stack.append(new)
 
-        return obj
+        return result
 
     def to_modict(self):
         """Convert this instance and all nested dicts to modicts in-place.
@@ -1512,9 +1708,12 @@ class modict(dict, metaclass=modictMeta):
         Takes any object as input and converts nested modicts to plain dicts.
         Handles circular references gracefully.
 
+        Like convert(), the traversal uses an explicit work stack rather than recursion.
+
         Args:
             obj: The object to unconvert
-            seen: Internal dict for tracking circular references (used in recursion)
+            seen: Internal dict mapping input object ids to unconverted values
+                (used to handle circular and shared references)
 
         Returns:
             The unconverted object:
@@ -1532,23 +1731,34 @@ class modict(dict, metaclass=modictMeta):
         """
         if seen is None:
             seen = {}  # Map object id -> unconverted value
-
-        obj_id = id(obj)
-        if obj_id in seen:
-            return seen[obj_id]
-
-        # if modict : we downgrade to dict first
-        if isinstance(obj, modict):
-            obj = dict(obj)
-
-        seen[obj_id] = obj
-
-        if is_mutable_container(obj):
+        inputs = []  # keeps input nodes alive (see convert)
+
+        def downgrade(node):
+            """Return (unconverted node, whether its children must be visited)."""
+            node_id = id(node)
+            if node_id in seen:
+                return seen[node_id], False
+            inputs.append(node)
+
+            # if modict : we downgrade to dict first
+            if isinstance(node, modict):
+                node = dict(node)
+
+            seen[node_id] = node
+            return node, is_mutable_container(node)
+
+        result, expand = downgrade(obj)
+        stack = [result] if expand else []
+        while stack:
+            node = stack.pop()
             # We unconvert in situ to preserve references of original containers as much as possible
-            for k, v in unroll(obj):
-                obj[k] = cls.unconvert(v, seen)
+            for k, v in unroll(node):
+                new, expand = downgrade(v)
+                node[k] = new
+                if expand:
+                    stack.append(new)
 
-        return obj
+        return result
 
     def to_dict(self):
         """Convert this modict and all nested modicts to plain dicts in-place.
@@ -2020,7 +2230,8 @@ class modict(dict, metaclass=modictMeta):
             >>> m
             modict({'a': {'b': {'d': 2}, 'e': 3}})
         """
-        deep_merge(self,other)
+        with self._batched():
+            deep_merge(self,other)
 
     def diff(self, other: Mapping):
         """Compare this modict with another mapping and return their differences.
@@ -2082,8 +2293,9 @@ class modict(dict, metaclass=modictMeta):
     def deep_equals(self, other: Mapping):
         """Compare two nested structures deeply for equality.
 
-        Compares by walking through both structures and comparing their flattened
-        representations.
+        Walks both structures side by side and stops at the first mismatch.
+        Mappings compare by keys regardless of class (modict vs dict), sequences
+        by position, and leaves with ``==``.
 
         Args:
             other: Mapping to compare with
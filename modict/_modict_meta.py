@@ -2,11 +2,13 @@ from collections.abc import ValuesView, ItemsView, KeysView
 from typing import Optional, Union, Tuple, Set, Dict, List, Any, Type, Callable, Literal
 from types import FunctionType
 from ._collections_utils import MISSING
+from ._typechecker import compile_check
 from dataclasses import dataclass, field, fields, MISSING as DC_MISSING
 from typing import FrozenSet
 import warnings
 import inspect
 import sys
+from weakref import WeakKeyDictionary
 
 
 def _get_annotations(dct: dict, name: str, bases: tuple) -> dict:
@@ -464,6 +466,33 @@ class ModelValidator:
         except Exception as e:
             raise ValueError(f"Error in model validator: {e}")
 
+# Numba-compiled versions of jit computed functions, shared by all Computed copies.
+# A function maps to itself when it can't be compiled (Numba missing or unsupported code).
+_jit_compiled: "WeakKeyDictionary[Callable, Callable]" = WeakKeyDictionary()
+
+
+def _jit_compile(func: Callable) -> Callable:
+    """Return a Numba-compiled version of func, or func itself if Numba is unavailable."""
+    compiled = _jit_compiled.get(func)
+    if compiled is None:
+        try:
+            import numba
+            compiled = numba.njit(cache=True)(func)
+        except Exception:
+            compiled = func
+        _jit_compiled[func] = compiled
+    return compiled
+
+
+def _numba_errors() -> Tuple[type, ...]:
+    """Return the exception types Numba raises when it fails to type/compile a function."""
+    try:
+        from numba.core.errors import NumbaError
+    except Exception:
+        return ()
+    return (NumbaError,)
+
+
 class Computed:
     """
     Represents a computed property that dynamically calculates its value.
@@ -473,30 +502,64 @@ class Computed:
         cache: Whether to cache the computed value (default: False)
         deps: List of keys to watch for cache invalidation. If None, cache is invalidated
               on any change. If empty list [], cache is never invalidated automatically.
+        jit: If True, func takes the values of deps as positional arguments instead of
+             the instance, and is compiled with numba.njit on first use (falls back to
+             plain Python when Numba is not installed or can't compile it). Requires deps.
     """
     
-    def __init__(self, func: Callable, cache: bool = False, deps: Optional[List[str]] = None):
+    def __init__(self, func: Callable, cache: bool = False, deps: Optional[List[str]] = None, jit: bool = False):
         self.func = func
         self.cache = cache
         # Si deps pas fourni explicitement, le récupérer de la fonction décorée
         if deps is None and hasattr(func, '_computed_deps'):
             deps = func._computed_deps
         self.deps = deps  # None = invalider sur tout changement, [] = jamais invalider auto
+        if jit and deps is None:
+            raise ValueError("jit=True requires explicit deps (their values are passed as arguments)")
+        self.jit = jit
         self._cached_value = MISSING
+        self._cached_stamp = None  # versions of the dependencies when the value was cached
+        # version counters of the instance that cached the value: a Computed object may be
+        # shared between instances (e.g. after copy()) whose counters happen to be equal
+        self._cached_owner = None
         self._cache_valid = False
+        # (owner class, version slots, layout) of the flattened dependencies, attached when a
+        # class injects this computed as a default (see compute_stamp_plans); None = walk deps
+        self._stamp_plan = None
 
     def copy(self):
-        return Computed(self.func,self.cache,deps=self.deps)
+        return Computed(self.func,self.cache,deps=self.deps,jit=self.jit)
+
+    def _call_jit(self, instance):
+        """Call the jit version of func with the values of deps."""
+        args = [instance[dep] for dep in self.deps]
+        compiled = _jit_compile(self.func)
+        if compiled is self.func:
+            return compiled(*args)
+        try:
+            return compiled(*args)
+        except _numba_errors():
+            # Numba failed to type/compile these arguments: stick to plain Python.
+            # Errors raised by func itself propagate, without running it again.
+            _jit_compiled[self.func] = self.func
+            return self.func(*args)
 
     def __call__(self, instance):
         """Compute the value for the given modict instance."""
-        if self.cache and self._cache_valid:
-            return self._cached_value
-            
+        if self.cache:
+            # The cache is valid as long as the versions of the dependencies are unchanged
+            get_stamp = getattr(type(instance), "_computed_stamp", None)
+            stamp = get_stamp(instance, self) if get_stamp is not None else None
+            owner = getattr(instance, "__versions__", None)
+            if self._cache_valid and owner is self._cached_owner and stamp == self._cached_stamp:
+                return self._cached_value
+
         try:
-            value = self.func(instance)
+            value = self._call_jit(instance) if self.jit else self.func(instance)
             if self.cache:
                 self._cached_value = value
+                self._cached_stamp = stamp
+                self._cached_owner = owner
                 self._cache_valid = True
             return value
         except Exception as e:
@@ -506,28 +569,9 @@ class Computed:
         """Invalidate the cached value."""
         self._cache_valid = False
         self._cached_value = MISSING
+        self._cached_stamp = None
+        self._cached_owner = None
 
-    def should_invalidate_for_keys(self, keys: set) -> bool:
-        """
-        Check if this computed should be invalidated when any of the given keys change.
-        
-        Args:
-            keys: Set of keys that have changed
-            
-        Returns:
-            bool: True if cache should be invalidated
-        """
-        if not self.cache:
-            return False  # Pas de cache = pas d'invalidation
-            
-        if self.deps is None:
-            return True  # None = invalider sur tout changement
-            
-        if len(self.deps) == 0:
-            return False  # Liste vide = jamais invalider automatiquement
-            
-        # Invalider si au moins une dépendance est dans les clés modifiées
-        return bool(set(self.deps) & keys)
 
 class Field:
     def __init__(
@@ -640,6 +684,166 @@ def is_field(key: str, value: Any, name: str, bases: Tuple[Type, ...], dct: Dict
     return True
 
 
+class FieldAccessor:
+    """Class-level descriptor giving declared fields a direct attribute access path.
+
+    Without it, `instance.name` first fails the regular attribute lookup before falling
+    back to modict.__getattr__. The descriptor resolves declared fields in one step, still
+    reading and writing through the mapping interface (values live in the dict).
+    On the class itself it raises AttributeError, so declared fields are not seen as class
+    attributes (which would change how modict routes attribute assignment).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            raise AttributeError(self.name)
+        try:
+            return instance[self.name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self.name}'"
+            ) from None
+
+    def __set__(self, instance, value):
+        instance[self.name] = value
+
+    def __delete__(self, instance):
+        try:
+            del instance[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
+def compute_stamp_plans(
+    class_fields: Dict[str, "Field"], version_slots: Dict[Any, int]
+) -> Dict[str, Tuple[Tuple[int, ...], Tuple[Tuple[Any, Optional["Computed"]], ...]]]:
+    """Flatten the dependencies of the cached computed fields of a class into version slots.
+
+    A computed depending on other computeds is stamped with the versions of everything
+    it transitively depends on. The class declarations fix that dependency graph, so it is
+    walked once here instead of on every access. Dependency keys without a slot get one
+    appended to version_slots.
+
+    The graph only holds while the instance stores the declared values at the keys it
+    goes through, so each plan also records its layout: every dependency key with its
+    declared Computed, or None for plain values (see modict._computed_stamp).
+
+    Computeds whose graph reaches a Factory default (which may produce a computed) or
+    that depend on any change (deps=None) are left out and walked at runtime.
+
+    Returns:
+        Mapping of computed field name to (version slots of its stamp, layout).
+    """
+    def slot_of(key):
+        slot = version_slots.get(key)
+        if slot is None:
+            slot = version_slots[key] = len(version_slots) + 1
+        return slot
+
+    plans = {}
+    for name, fld in class_fields.items():
+        root = fld.default
+        if not isinstance(root, Computed) or not root.cache or root.deps is None:
+            continue
+        slots: Dict[int, None] = {}
+        layout: Dict[Any, Optional[Computed]] = {}
+        visited = {name}
+        stack = [root]
+        while stack and slots is not None:
+            computed = stack.pop()
+            if computed.deps is None:
+                slots[0] = None
+                continue
+            for dep in computed.deps:
+                slots[slot_of(dep)] = None
+                dep_field = class_fields.get(dep)
+                dep_default = dep_field.default if dep_field is not None else None
+                if isinstance(dep_default, Factory):
+                    slots = None
+                    break
+                if isinstance(dep_default, Computed):
+                    layout[dep] = dep_default
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append(dep_default)
+                else:
+                    layout.setdefault(dep, None)
+        if slots is not None:
+            plans[name] = (tuple(slots), tuple(layout.items()))
+    return plans
+
+
+def build_default_injector(
+    name: str,
+    fields: Dict[str, "Field"],
+    module: Optional[str] = None,
+    stamp_plans: Optional[Dict[str, Tuple]] = None,
+) -> Callable:
+    """Generate the function injecting the defaults of a class's fields into a new instance.
+
+    The fields are known at class creation, so the loop over them is unrolled into
+    straight-line code (one block per field having a default), exec'd once per class.
+    The generated function keeps the semantics of Field.get_default(): factories are
+    called for every instance, Computed defaults are copied, and providing a value
+    for a computed field raises unless override_computed is enabled. Injected computeds
+    get their flattened dependency plan from stamp_plans (see compute_stamp_plans),
+    tagged with the class of the instance they are injected into.
+    """
+    stamp_plans = stamp_plans or {}
+    namespace: Dict[str, Any] = {"_dict_setitem": dict.__setitem__, "_Computed": Computed}
+    lines = ["def __inject_defaults__(self):"]
+    for index, (key, fld) in enumerate(fields.items()):
+        default = fld.default
+        if default is MISSING:
+            continue
+        field_ref = f"_field_{index}"
+        key_ref = f"_key_{index}"
+        namespace[field_ref] = fld
+        namespace[key_ref] = key
+        message = (
+            f"Cannot override computed field {key!r} at initialization (override_computed=False)"
+        )
+        if isinstance(default, (Factory, Computed)):
+            # dynamic default: may be (or produce) a Computed needing the override check
+            lines += [
+                f"    value = {field_ref}.get_default()",
+                "    if value is not _MISSING:",
+                "        if isinstance(value, _Computed):",
+            ]
+            if key in stamp_plans:
+                slots_ref, layout_ref = f"_slots_{index}", f"_layout_{index}"
+                namespace[slots_ref], namespace[layout_ref] = stamp_plans[key]
+                lines.append(
+                    f"            value._stamp_plan = (type(self), {slots_ref}, {layout_ref})"
+                )
+            lines += [
+                f"            if {key_ref} in self:",
+                "                if not getattr(self._config, 'override_computed', False):",
+                f"                    raise TypeError({message!r})",
+                "            else:",
+                f"                _dict_setitem(self, {key_ref}, value)",
+                f"        elif {key_ref} not in self:",
+                f"            _dict_setitem(self, {key_ref}, value)",
+            ]
+        else:
+            lines += [
+                f"    if {key_ref} not in self:",
+                f"        _dict_setitem(self, {key_ref}, {field_ref}.default)",
+            ]
+    if len(lines) == 1:
+        lines.append("    pass")
+    namespace["_MISSING"] = MISSING
+    exec("\n".join(lines), namespace)
+    injector = namespace["__inject_defaults__"]
+    injector.__qualname__ = f"{name}.__inject_defaults__"
+    if module is not None:
+        injector.__module__ = module
+    return injector
+
+
 class modictMeta(type):
 
     def __new__(mcls, name, bases, dct):
@@ -667,7 +871,8 @@ class modictMeta(type):
                     # @modict.computed() decorated method
                     cache = getattr(value, '_computed_cache', False)
                     deps = getattr(value, '_computed_deps', None)
-                    computed_obj = Computed(value, cache=cache, deps=deps)
+                    jit = getattr(value, '_computed_jit', False)
+                    computed_obj = Computed(value, cache=cache, deps=deps, jit=jit)
                     # Priorité : annotation de classe, puis annotation de retour de la fonction
                     func_return_hint = getattr(value, '__annotations__', {}).get('return')
                     final_hint = hint if hint is not None else func_return_hint
@@ -693,7 +898,8 @@ class modictMeta(type):
                         # @modict.computed() decorated method
                         cache = getattr(value, '_computed_cache', False)
                         deps = getattr(value, '_computed_deps', None)
-                        computed_obj = Computed(value, cache=cache, deps=deps)
+                        jit = getattr(value, '_computed_jit', False)
+                        computed_obj = Computed(value, cache=cache, deps=deps, jit=jit)
                         # Pour les champs computed, utiliser l'annotation de retour de la fonction
                         func_return_hint = getattr(value, '__annotations__', {}).get('return')
                         fields[key] = Field(default=computed_obj, hint=func_return_hint, required=False)
@@ -731,6 +937,40 @@ class modictMeta(type):
 
         # Store fields in __fields__
         dct['__fields__'] = fields
+        # Direct attribute access for declared fields, unless the name is taken by an
+        # attribute of the class or of its bases (e.g. a dict method)
+        accessors = []
+        for key in fields:
+            if (
+                isinstance(key, str)
+                and key.isidentifier()
+                and not key.startswith('__')
+                and key not in dct
+                and not any(hasattr(base, key) for base in bases)
+            ):
+                dct[key] = FieldAccessor(key)
+                accessors.append(key)
+        dct['__field_accessors__'] = frozenset(accessors)
+        # Version counter slot of each declared field (slot 0 counts every change), then of
+        # the other keys computeds depend on; used to validate cached computed values.
+        version_slots = {key: slot for slot, key in enumerate(fields, start=1)}
+        stamp_plans = compute_stamp_plans(fields, version_slots)
+        dct['__version_slots__'] = version_slots
+        # Specialized default injection for __init__
+        dct['__inject_defaults__'] = build_default_injector(
+            name, fields, dct.get('__module__'), stamp_plans
+        )
+        # Declarations enabling the key/value checks in "auto" mode (see modict._check_*_enabled)
+        dct['__has_key_constraints__'] = any(
+            field.required or isinstance(field.default, Computed) for field in fields.values()
+        )
+        dct['__has_value_constraints__'] = bool(model_validators) or any(
+            field.hint is not None or field.validators for field in fields.values()
+        )
+        # Type checks of the field hints, compiled once per class
+        dct['__checkers__'] = {
+            key: compile_check(field.hint) for key, field in fields.items() if field.hint is not None
+        }
         dct["__model_validators__"] = tuple(model_validators)
 
         # Setup _config using modictConfig with proper MRO merging
@@ -1,5 +1,6 @@
 from ._public_api import (
     check_type,
+    compile_check,
     typechecked,
     coerced,
     coerce,
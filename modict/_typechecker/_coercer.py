@@ -20,20 +20,115 @@ class Coercer:
         self.type_checker = type_checker
         self._coercion_strategies = self._build_coercion_strategies()
         self._canonical_containers = self._build_canonical_containers()
+        # Compiled type check and coercion method of each hint seen (see _compile_hint)
+        self._compiled_hints: Dict[Any, Tuple[Callable, Callable]] = {}
     
     def coerce(self, value: Any, target_hint: Any) -> Any:
         """
         Point d'entrée principal : tente de coercer value vers target_hint.
         """
-        # Si déjà compatible, pas de coercion
+        compiled = self._compile_hint(target_hint)
+        if compiled is None:
+            # Si déjà compatible, pas de coercion
+            try:
+                if self.type_checker.check_type(target_hint, value):
+                    return value
+            except (TypeMismatchError, TypeCheckError):
+                pass
+
+            # Sinon, tentative de coercion intelligente
+            return self._attempt_smart_coercion(value, target_hint)
+
+        check, coerce_to_hint = compiled
         try:
-            if self.type_checker.check_type(target_hint, value):
+            if check(value):
                 return value
         except (TypeMismatchError, TypeCheckError):
             pass
-        
-        # Sinon, tentative de coercion intelligente
-        return self._attempt_smart_coercion(value, target_hint)
+        return coerce_to_hint(value, target_hint)
+
+    def _compile_hint(self, target_hint: Any) -> Optional[Tuple[Callable, Callable]]:
+        """
+        Return (check, coerce_to_hint) for target_hint, analysed once and cached.
+
+        check is TypeChecker.compile_check(target_hint), and coerce_to_hint(value, hint) is
+        the method _attempt_smart_coercion dispatches target_hint to. Nested hints hit the
+        cache again when coercing elements, so coercing a container doesn't re-inspect
+        its element hint for every item.
+
+        The cache is keyed by hint equality, and equal hints may differ in ways that matter
+        for coercion (Union[int, str] == Union[str, int]), so only the dispatch is cached:
+        the methods still receive the actual hint. Forward references (resolved from the
+        caller's frames) and unhashable hints return None and take the uncached path.
+        """
+        if isinstance(target_hint, str):
+            return None
+        cache = self._compiled_hints
+        try:
+            compiled = cache.get(target_hint)
+        except TypeError:
+            return None
+        if compiled is None:
+            if len(cache) >= 4096:
+                cache.clear()
+            compiled = (
+                self.type_checker.compile_check(target_hint),
+                self._select_coercion(target_hint),
+            )
+            cache[target_hint] = compiled
+        return compiled
+
+    def _check_type(self, hint: Any, value: Any) -> bool:
+        """
+        type_checker.check_type(hint, value), via the compiled check when hint is cacheable.
+        """
+        compiled = self._compile_hint(hint)
+        if compiled is None:
+            return self.type_checker.check_type(hint, value)
+        return compiled[0](value)
+
+    def _select_coercion(self, target_hint: Any) -> Callable[[Any, Any], Any]:
+        """
+        Choisit une fois la méthode (value, hint) -> value vers laquelle
+        _attempt_smart_coercion aiguillerait target_hint (hors forward references).
+        """
+        type_checker = self.type_checker
+        if type_checker._is_protocol(target_hint):
+            return self._attempt_smart_coercion
+        elif type_checker._is_typeddict(target_hint):
+            return self._coerce_typeddict
+        elif type_checker._is_newtype(target_hint):
+            return self._coerce_newtype
+        elif type_checker._is_special_form(target_hint):
+            form_name = type_checker._get_special_form_name(target_hint)
+            if form_name == 'Union':
+                return self._coerce_union
+            elif form_name == 'Optional':
+                return self._coerce_optional
+            elif form_name == 'Literal':
+                return self._coerce_literal
+            return self._coerce_special_form
+        elif type_checker._is_generic_alias(target_hint):
+            checker = type_checker._get_checker(get_origin(target_hint))
+            method = {
+                type_checker._check_sequence_like: self._coerce_sequence_like,
+                type_checker._check_mapping_like: self._coerce_mapping_like,
+                type_checker._check_set_like: self._coerce_set_like,
+                type_checker._check_tuple_like: self._coerce_tuple_like,
+                type_checker._check_iterable_like: self._coerce_iterable_like,
+                type_checker._check_collection_like: self._coerce_iterable_like,
+                type_checker._check_container_like: self._coerce_container_like,
+                type_checker._check_iterator_like: self._coerce_iterator_like,
+            }.get(checker) if checker is not None else None
+            if method is None:
+                return self._coerce_generic_alias
+            return lambda value, hint: method(value, hint, get_origin(hint), get_args(hint))
+        elif type_checker._is_basic_type(target_hint):
+            return self._coerce_basic_type
+        elif isinstance(target_hint, TypeVar):
+            return self._coerce_typevar
+        else:
+            return self._fallback_coercion
     
     def _attempt_smart_coercion(self, value: Any, target_hint: Any) -> Any:
         """
@@ -98,7 +193,7 @@ class Coercer:
         for union_type in args:
             try:
                 # D'abord vérifier si déjà compatible
-                if self.type_checker.check_type(union_type, value):
+                if self._check_type(union_type, value):
                     return value
             except (TypeMismatchError, TypeCheckError):
                 continue
@@ -108,7 +203,7 @@ class Coercer:
             try:
                 coerced = self.coerce(value, union_type)  # Récursion intelligente !
                 # Valider que la coercion a marché
-                if self.type_checker.check_type(union_type, coerced):
+                if self._check_type(union_type, coerced):
                     return coerced
             except (CoercionError, TypeMismatchError):
                 continue
@@ -117,6 +117,131 @@ def check_type(hint: Any, value: Any) -> bool:
     return _get_global_typechecker().check_type(hint, value)
 
 
+def compile_check(hint: Any) -> Callable[[Any], bool]:
+    """
+    Compile a type hint into a reusable checking function.
+
+    The returned function behaves like check_type(hint, value), but the hint is
+    analysed only once, which pays off when checking many values against it.
+
+    Args:
+        hint: A type annotation or typing construct
+
+    Returns:
+        Callable: A function taking a value, returning True if it matches the hint
+
+    Examples:
+        >>> check = compile_check(List[int])
+        >>> check([1, 2, 3])
+        True
+        >>> check(["a"])  # raises TypeMismatchError
+    """
+    return _get_global_typechecker().compile_check(hint)
+
+
+def _build_typechecked_wrapper(func, signature: inspect.Signature, checker: TypeChecker) -> Optional[Callable]:
+    """
+    Generate the typechecked wrapper of func, specialized to its signature.
+
+    The wrapper repeats the parameters of func (so Python binds the arguments and
+    applies defaults itself) and runs the compiled check of each annotated parameter
+    inline, then the return check, raising TypeMismatchError like the generic wrapper.
+    Returns None when the source can't be generated safely (parameter names clashing
+    with the generated names, signature not reproducible), so the generic wrapper is used.
+    """
+    annotations = dict(func.__annotations__)
+    namespace: Dict[str, Any] = {
+        "_tc_func": func,
+        "_tc_type": type,
+        "_tc_TypeMismatchError": TypeMismatchError,
+    }
+    params: List[str] = []
+    call_args: List[str] = []
+    checks: List[str] = []
+    kind = inspect.Parameter
+    previous_kind = None
+
+    def raise_line(indent: str, what: str, hint_ref: str, value: str) -> str:
+        return (
+            f"{indent}raise _tc_TypeMismatchError(f\"{what}: expected {{{hint_ref}}}, "
+            f"got {{_tc_type({value})}}\") from None"
+        )
+
+    for index, (name, param) in enumerate(signature.parameters.items()):
+        if name.startswith("_tc_"):
+            return None
+        if previous_kind is kind.POSITIONAL_ONLY and param.kind is not kind.POSITIONAL_ONLY:
+            params.append("/")
+        if param.kind is kind.KEYWORD_ONLY and previous_kind not in (kind.KEYWORD_ONLY, kind.VAR_POSITIONAL):
+            params.append("*")
+        previous_kind = param.kind
+
+        if param.kind is kind.VAR_POSITIONAL:
+            params.append(f"*{name}")
+            call_args.append(f"*{name}")
+        elif param.kind is kind.VAR_KEYWORD:
+            params.append(f"**{name}")
+            call_args.append(f"**{name}")
+        else:
+            if param.default is not inspect.Parameter.empty:
+                namespace[f"_tc_default_{index}"] = param.default
+                params.append(f"{name}=_tc_default_{index}")
+            else:
+                params.append(name)
+            call_args.append(f"{name}={name}" if param.kind is kind.KEYWORD_ONLY else name)
+
+        if name not in annotations:
+            continue
+        check_ref, hint_ref = f"_tc_check_{index}", f"_tc_hint_{index}"
+        namespace[check_ref] = checker.compile_check(annotations[name])
+        namespace[hint_ref] = annotations[name]
+        if param.kind is kind.VAR_POSITIONAL:
+            checks += [
+                f"    for _tc_item in {name}:",
+                "        try:",
+                f"            {check_ref}(_tc_item)",
+                "        except _tc_TypeMismatchError:",
+                raise_line("            ", f"Argument '{name}' has invalid item", hint_ref, "_tc_item"),
+            ]
+        elif param.kind is kind.VAR_KEYWORD:
+            checks += [
+                f"    for _tc_key, _tc_item in {name}.items():",
+                "        try:",
+                f"            {check_ref}(_tc_item)",
+                "        except _tc_TypeMismatchError:",
+                raise_line("            ", f"Argument '{name}[{{_tc_key}}]' has invalid type", hint_ref, "_tc_item"),
+            ]
+        else:
+            checks += [
+                "    try:",
+                f"        {check_ref}({name})",
+                "    except _tc_TypeMismatchError:",
+                raise_line("        ", f"Argument '{name}' has invalid type", hint_ref, name),
+            ]
+    if previous_kind is kind.POSITIONAL_ONLY:
+        params.append("/")
+
+    func_name = func.__name__ if func.__name__.isidentifier() else "wrapper"
+    lines = [f"def {func_name}({', '.join(params)}):"]
+    lines += checks
+    lines.append(f"    _tc_result = _tc_func({', '.join(call_args)})")
+    if "return" in annotations:
+        namespace["_tc_check_return"] = checker.compile_check(annotations["return"])
+        namespace["_tc_hint_return"] = annotations["return"]
+        lines += [
+            "    try:",
+            "        _tc_check_return(_tc_result)",
+            "    except _tc_TypeMismatchError:",
+            raise_line("        ", "Return value has invalid type", "_tc_hint_return", "_tc_result"),
+        ]
+    lines.append("    return _tc_result")
+    try:
+        exec("\n".join(lines), namespace)
+    except SyntaxError:
+        return None
+    return namespace[func_name]
+
+
 # Decorator for runtime type checking
 def typechecked(func):
     """
@@ -132,6 +257,10 @@ def typechecked(func):
         
     signature = inspect.signature(func)
     checker = _get_global_typechecker()
+
+    wrapper = _build_typechecked_wrapper(func, signature, checker)
+    if wrapper is not None:
+        return functools.wraps(func)(wrapper)
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -185,6 +185,183 @@ class TypeChecker:
             raise
         except Exception as e:
             raise TypeCheckFailureError(f"Error during type checking: {str(e)}")
+
+    def compile_check(self, hint: Any) -> Callable[[Any], bool]:
+        """
+        Compile a type hint into a checking function equivalent to check_type(hint, value).
+        The hint is analysed once, so repeated checks against the same hint skip the
+        dispatch over typing constructs done by check_type.
+
+        Args:
+            hint: A type annotation or typing construct
+
+        Returns:
+            Callable: A function taking a value, returning True if it matches the hint
+                and raising the same exceptions as check_type otherwise
+        """
+        predicate = self._compile_predicate(hint)
+
+        def check(value):
+            try:
+                result = predicate(value)
+            except TypeCheckException:
+                raise
+            except Exception as e:
+                raise TypeCheckFailureError(f"Error during type checking: {str(e)}")
+            if result is True:
+                return True
+            if result is False:
+                raise TypeMismatchError()
+            raise TypeCheckFailureError(
+                f"_check_type_internal returned non-boolean value: {result}"
+            )
+
+        return check
+    #endregion
+
+    #region: compiled predicates
+
+    def _compile_predicate(self, hint):
+        """
+        Build a function value -> bool equivalent to _check_type_internal(hint, value).
+        Common hints (None, Any, plain classes, homogeneous collections, tuples, unions,
+        literals) get a specialized closure. Anything else is delegated to
+        _check_type_internal at call time (e.g. forward references, which must be
+        resolved lazily).
+        """
+        try:
+            predicate = self._compile_specialized(hint)
+        except Exception:
+            predicate = None
+        if predicate is None:
+            check_internal = self._check_type_internal
+            predicate = lambda value: check_internal(hint, value)
+        return predicate
+
+    def _compile_specialized(self, hint):
+        """Return a specialized predicate for hint, or None if it has no fast path."""
+        # Follows the dispatch order of _check_type_internal
+        if hint in (None, type(None)):
+            return lambda value: value is None
+        if hint in (Any, object):
+            return lambda value: True
+        if isinstance(hint, str) or self._is_typeddict(hint) or self._is_protocol(hint):
+            return None
+        if hasattr(typing, "Self") and hint is typing.Self:
+            return None
+
+        if self._is_special_form(hint):
+            if (hasattr(types, "UnionType") and isinstance(hint, types.UnionType)) or get_origin(hint) is Union:
+                args = get_args(hint)
+                if not args:
+                    return None
+                return self._compile_union(args)
+            if self._get_special_form_name(hint) == 'Literal':
+                literals = get_args(hint)
+                return lambda value: value in literals
+            return None
+
+        if self._is_generic_alias(hint):
+            origin = get_origin(hint)
+            if origin is None or self._is_parameterized_generic(origin, hint):
+                return None
+            checker = self._get_checker(origin)
+            if checker is None:
+                return None
+            args = get_args(hint)
+            container = self._origin_to_type(origin)
+            if checker == self._check_sequence_like and len(args) == 1:
+                return self._compile_sequence(container, self._compile_predicate(args[0]))
+            if checker == self._check_set_like and len(args) == 1:
+                return self._compile_items(container, self._compile_predicate(args[0]))
+            if checker == self._check_mapping_like and len(args) == 2:
+                return self._compile_mapping(
+                    container, self._compile_predicate(args[0]), self._compile_predicate(args[1])
+                )
+            if checker == self._check_tuple_like:
+                return self._compile_tuple(container, args)
+            return None
+
+        if self._is_generic_class(hint):
+            return None
+
+        if self._is_basic_type(hint):
+            if hint is int:
+                return lambda value: isinstance(value, int) and not isinstance(value, bool)
+            return lambda value: isinstance(value, hint)
+
+        return None
+
+    def _compile_union(self, args):
+        predicates = tuple(self._compile_predicate(arg) for arg in args)
+
+        def check_union(value):
+            for predicate in predicates:
+                if predicate(value):
+                    return True
+            return False
+
+        return check_union
+
+    def _compile_sequence(self, container, check_item):
+        def check_sequence(value):
+            if not isinstance(value, container):
+                return False
+            # Handle iterators specially - don't consume them
+            if isinstance(value, collections.abc.Iterator):
+                return True
+            for item in value:
+                if not check_item(item):
+                    return False
+            return True
+
+        return check_sequence
+
+    def _compile_items(self, container, check_item):
+        def check_items(value):
+            if not isinstance(value, container):
+                return False
+            for item in value:
+                if not check_item(item):
+                    return False
+            return True
+
+        return check_items
+
+    def _compile_mapping(self, container, check_key, check_value):
+        def check_mapping(value):
+            if not isinstance(value, container):
+                return False
+            for k, v in value.items():
+                if not (check_key(k) and check_value(v)):
+                    return False
+            return True
+
+        return check_mapping
+
+    def _compile_tuple(self, container, args):
+        # Empty tuple - Tuple[()]
+        if len(args) == 1 and args[0] == ():
+            return lambda value: isinstance(value, container) and len(value) == 0
+
+        # Variable length tuple - Tuple[int, ...]
+        if len(args) == 2 and args[1] is ...:
+            return self._compile_items(container, self._compile_predicate(args[0]))
+
+        # Fixed length tuple - Tuple[int, str, bool]
+        predicates = tuple(self._compile_predicate(arg) for arg in args)
+        size = len(predicates)
+
+        def check_fixed_tuple(value):
+            if not isinstance(value, container) or len(value) != size:
+                return False
+            for predicate, item in zip(predicates, value):
+                if not predicate(item):
+                    return False
+            return True
+
+        return check_fixed_tuple
+
     #endregion
 
     #region: hint parsing
@@ -267,6 +267,46 @@ class TestDeepEquals:
         assert deep_equals(dict1, dict2)
 
 
+    def test_deep_equals_mixed_container_classes(self):
+        """Test deep_equals across mapping/sequence classes and with empty containers."""
+        assert deep_equals(modict(a=[1, modict(b=2)]), {'a': (1, {'b': 2})})
+        assert not deep_equals({'a': {}}, {})
+        assert not deep_equals({'a': {}}, {'a': []})
+        assert not deep_equals({'a': 'xy'}, {'a': ['x', 'y']})
+
+    def test_deep_equals_very_deep_structures(self):
+        """Test deep_equals beyond the recursion limit."""
+        deep1, deep2 = {}, {}
+        node1, node2 = deep1, deep2
+        for _ in range(5000):
+            node1['n'] = {}
+            node2['n'] = {}
+            node1, node2 = node1['n'], node2['n']
+        node1['leaf'] = 1
+        node2['leaf'] = 1
+        assert deep_equals(deep1, deep2)
+        node2['leaf'] = 2
+        assert not deep_equals(deep1, deep2)
+
+
+    def test_deep_equals_cyclic_structures(self):
+        """Test deep_equals terminates on self-referencing structures."""
+        a, b = [], []
+        a.append(a)
+        b.append(b)
+        assert deep_equals(a, b)
+
+        c, d = [1], [2]
+        c.append(c)
+        d.append(d)
+        assert not deep_equals(c, d)
+
+        m1, m2 = modict(x=1), modict(x=1)
+        dict.__setitem__(m1, 'self', m1)
+        dict.__setitem__(m2, 'self', m2)
+        assert m1.deep_equals(m2)
+
+
 class TestModictDeepOperations:
     """Tests for modict deep operation methods."""
 
@@ -294,6 +334,26 @@ class TestModictDeepOperations:
         m.merge({'user': {'email': MISSING}})
         assert m == {'user': {'name': 'Alice', 'age': 30}}
 
+    def test_modict_merge_invalidates_cached_computed(self):
+        """Test that merge() invalidates cached computeds once all writes are applied."""
+        calls = []
+
+        class Totals(modict):
+            a: int = 1
+            b: int = 2
+
+            @modict.computed(cache=True, deps=['a', 'b'])
+            def total(self):
+                calls.append((self.a, self.b))
+                return self.a + self.b
+
+        t = Totals()
+        assert t.total == 3
+        t.merge({'a': 10, 'b': 20, 'c': {'d': 1}})
+        assert t.total == 30
+        assert t.total == 30
+        assert calls == [(1, 2), (10, 20)]
+
     def test_modict_diff(self):
         """Test modict.diff() method."""
         m1 = modict(x=1, y=modict(z=2))
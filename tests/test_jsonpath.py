@@ -153,6 +153,16 @@ class TestParseJSONPath:
         with pytest.raises(ValueError):
             parse_jsonpath("a.b")
 
+    def test_repeated_parsing_reuses_components(self):
+        """Parsing the same JSONPath twice reuses the cached components."""
+        first = parse_jsonpath('$.users[0].name')
+        second = parse_jsonpath('$.users[0].name')
+        assert first == second
+        assert first.components is second.components
+
+        with pytest.raises(ValueError):
+            parse_jsonpath("a.b")  # errors are raised on every call, never cached
+
     def test_mixed_access(self):
         """Test parsing mixed key and index access."""
         path = parse_jsonpath('$.data.items[0].metadata.tags[1]')
@@ -1,4 +1,6 @@
 import pytest
+import sys
+import types
 
 from typing import (
     Dict,
@@ -16,6 +18,7 @@ from typing import (
 import modict as modict_pkg
 from modict import (
     CoercionError,
+    Computed,
     TypeMismatchError,
     coerce,
     modict,
@@ -55,6 +58,25 @@ def test_auto_convert_nested_structures():
     assert data.get_nested("$.settings.theme") == "dark"
 
 
+def test_auto_convert_lists_keep_the_original_list():
+    payload = {"users": [{"id": 1}]}
+    data = modict(payload)
+
+    users = data.users
+    assert users is payload["users"]
+    assert isinstance(users[0], modict)
+
+    users.append({"id": 2})
+    assert len(payload["users"]) == 2
+    assert isinstance(data.users[1], modict)  # converted on the next read
+    assert isinstance(data.users.pop(), modict)
+    assert data.users is users
+
+    plain = data.to_dict()
+    assert type(plain["users"]) is list
+    assert plain["users"] == [{"id": 1}]
+
+
 def test_convert_recurse_flag_stops_at_modict_nodes():
     shallow = modict.convert({"a": {"b": {"c": 1}}}, recurse=False)
     assert isinstance(shallow, modict)
@@ -83,6 +105,58 @@ def test_convert_and_unconvert_roundtrip():
     assert not isinstance(back_to_dict["a"], modict)
 
 
+def test_convert_and_unconvert_deeply_nested():
+    import sys
+
+    depth = sys.getrecursionlimit() * 2
+    original = {}
+    for _ in range(depth):
+        original = {"items": [original]}
+
+    converted = modict.convert(original)
+    node = converted
+    for _ in range(depth):
+        assert isinstance(node, modict)
+        node = dict.__getitem__(node, "items")[0]
+
+    back_to_dict = modict.unconvert(converted)
+    node = back_to_dict
+    for _ in range(depth):
+        assert type(node) is dict
+        node = node["items"][0]
+
+
+def test_convert_handles_circular_references():
+    data = {"a": {"b": 1}}
+    data["self"] = data
+    data["a"]["parent"] = data
+
+    m = modict.convert(data)
+    assert m["self"] is m
+    assert isinstance(m.a, modict)
+    assert m.a["parent"] is m
+
+    items = [{"x": 1}]
+    items.append(items)
+    converted = modict.convert({"items": items})
+    raw_items = dict.__getitem__(converted, "items")
+    assert isinstance(raw_items[0], modict)
+    assert raw_items[1] is raw_items
+
+
+def test_convert_keeps_computed_values_live():
+    m = modict(a=1)
+    m["t"] = modict.computed(lambda m: m.a * 10)
+    m["sub"] = {"u": modict.computed(lambda m: 2)}
+
+    m.to_modict()
+    assert isinstance(dict.__getitem__(m, "t"), Computed)
+    assert isinstance(dict.__getitem__(m.sub, "u"), Computed)
+
+    m.a = 5
+    assert m.t == 50
+
+
 def test_computed_with_cache_and_invalidation():
     call_counter = {"count": 0}
 
@@ -105,6 +179,79 @@ def test_computed_with_cache_and_invalidation():
     assert call_counter["count"] == 2
 
 
+def test_computed_jit_receives_dependency_values():
+    # Runs through Numba when installed, plain Python otherwise
+    class Point(modict):
+        x: float = 3.0
+        y: float = 4.0
+
+        @modict.computed(cache=True, deps=["x", "y"], jit=True)
+        def norm(x, y):
+            return (x * x + y * y) ** 0.5
+
+    p = Point()
+    assert p.norm == 5.0
+    p.x = 0.0
+    assert p.norm == 4.0
+
+    m = modict(a=2)
+    m["double"] = modict.computed(lambda a: a * 2, deps=["a"], jit=True)
+    assert m.double == 4
+
+    with pytest.raises(ValueError):
+        modict.computed(lambda a: a, jit=True)
+
+
+def test_computed_jit_only_falls_back_on_numba_errors(monkeypatch):
+    class NumbaError(Exception):
+        pass
+
+    calls = []
+
+    def njit(cache=False):
+        def decorate(func):
+            def compiled(*args):
+                calls.append("jit")
+                if any(isinstance(arg, str) for arg in args):
+                    raise NumbaError("cannot type str")
+                return func(*args)
+            return compiled
+        return decorate
+
+    numba = types.ModuleType("numba")
+    numba.njit = njit
+    core = types.ModuleType("numba.core")
+    errors = types.ModuleType("numba.core.errors")
+    errors.NumbaError = NumbaError
+    monkeypatch.setitem(sys.modules, "numba", numba)
+    monkeypatch.setitem(sys.modules, "numba.core", core)
+    monkeypatch.setitem(sys.modules, "numba.core.errors", errors)
+
+    def ratio(a, b):
+        calls.append("py")
+        return a / b
+
+    m = modict(a=1, b=0)
+    m["ratio"] = modict.computed(ratio, deps=["a", "b"], jit=True)
+    with pytest.raises(ValueError, match="division by zero"):
+        _ = m.ratio
+    assert calls == ["jit", "py"]  # the user error isn't retried
+
+    m.b = 2
+    assert m.ratio == 0.5
+    assert calls[-2:] == ["jit", "py"]  # still compiled
+
+    def label(a):
+        calls.append("py")
+        return a.upper()
+
+    m["label"] = modict.computed(label, deps=["c"], jit=True)
+    m.c = "x"
+    calls.clear()
+    assert m.label == "X"
+    assert calls == ["jit", "py"]  # typing failure: plain Python
+
+
 def test_computed_annotation_hint_does_not_conflict_with_storage():
     """A computed field can be annotated (e.g. sum: int = modict.computed(...)).
 
@@ -142,6 +289,32 @@ def test_attribute_errors_for_missing_keys():
         del m.missing
 
 
+def test_declared_fields_use_dict_storage_through_attributes():
+    class User(modict):
+        name: str
+        age: int = 0
+
+    u = User(name="Alice")
+    assert not hasattr(User, "name")
+    assert u.age == 0
+    u.age = 31
+    assert dict.__getitem__(u, "age") == 31
+    assert "age" not in vars(u)
+    del u.name
+    assert "name" not in u
+    with pytest.raises(AttributeError):
+        _ = u.name
+
+
+def test_setitem_interns_string_keys():
+    key = "".join(["run", "time_key"])
+    assert key is not sys.intern("runtime_key")
+    m = modict()
+    m[key] = 1
+    stored = next(iter(m))
+    assert stored is sys.intern("runtime_key")
+
+
 def test_auto_convert_disabled():
     class NoAuto(modict):
         _config = modict.config(auto_convert=False)
@@ -681,6 +854,26 @@ def test_json_enforcement_blocks_non_serializable():
         inst.data = {1, 2, 3}  # set not JSON-serializable
 
 
+def test_json_enforcement_nested_values_and_nan():
+    class JSONOnly(modict):
+        _config = modict.config(enforce_json=True, validate_assignment=True, allow_inf_nan=False)
+        data: object
+
+    inst = JSONOnly(data={"a": [1, 2.5, None, (True, "x")], "b": {"c": []}})
+    inst.data = [{"k": 1}, {"k": 2}]
+    inst.data = {1: "int keys are encoded as strings by json"}
+
+    with pytest.raises(ValueError):
+        inst.data = {"a": [1, {2}]}
+    with pytest.raises(ValueError):
+        inst.data = [1.0, float("nan")]
+
+    cyclic = []
+    cyclic.append(cyclic)
+    with pytest.raises(ValueError):
+        inst.data = cyclic
+
+
 def test_merge_and_deep_equals():
     base = modict({"db": {"host": "localhost", "port": 5432}})
     base.merge({"db": {"port": 3306, "ssl": True}})
@@ -719,6 +912,111 @@ def test_computed_dependency_chain_invalidation():
     assert call_counter == {"sum": 2, "double": 2}
 
 
+def test_computed_chain_follows_runtime_replaced_dependency():
+    class Chain(modict):
+        a: int = 1
+        b: int = 2
+
+        @modict.computed(cache=True, deps=["a", "b"])
+        def summed(self):
+            return self.a + self.b
+
+        @modict.computed(cache=True, deps=["summed"])
+        def doubled(self):
+            return self.summed * 2
+
+    c = Chain(extra=3)
+    assert c.doubled == 6
+
+    # "a" now depends on "extra", which the class-level dependency graph doesn't know about
+    c.a = modict.computed(lambda m: m.extra * 10, cache=True, deps=["extra"])
+    assert c.doubled == 64
+    c.extra = 4
+    assert c.doubled == 84
+
+
+def test_computed_chain_follows_dependency_replaced_through_update():
+    class Chain(modict):
+        _config = modict.config(override_computed=True)
+        a: int = 1
+        b: int = 2
+
+        @modict.computed(cache=True, deps=["a", "b"])
+        def summed(self):
+            return self.a + self.b
+
+    c = Chain(extra=3)
+    assert c.summed == 3
+    # dict.update path: stores the computed without going through __setitem__
+    c.update(a=modict.computed(lambda m: m.extra * 10, cache=True, deps=["extra"]))
+    c.b = 2
+    assert c.summed == 32
+    c.extra = 4
+    assert c.summed == 42
+
+    d = Chain(extra=1)
+    assert d.summed == 3
+    d |= {"b": modict.computed(lambda m: m.extra + 100, cache=True, deps=["extra"])}
+    d.a = 0
+    assert d.summed == 101
+    d.extra = 2
+    assert d.summed == 102
+
+
+def test_computed_chain_through_uncached_computed():
+    call_counter = {"double": 0}
+
+    class Chain(modict):
+        a: int = 1
+        b: int = 2
+
+        @modict.computed(deps=["a", "b"])
+        def summed(self):
+            return self.a + self.b
+
+        @modict.computed(cache=True, deps=["summed"])
+        def doubled(self):
+            call_counter["double"] += 1
+            return self.summed * 2
+
+    c = Chain()
+    assert c.doubled == 6
+    c.c = 0  # unrelated key
+    assert c.doubled == 6
+    assert call_counter["double"] == 1
+
+    c.a = 5  # reaches doubled through the uncached summed
+    assert c.doubled == 14
+    assert call_counter["double"] == 2
+
+
+def test_computed_cache_is_not_shared_between_copies():
+    m1 = modict(a=1)
+    m1["t"] = modict.computed(lambda m: m.a * 10, cache=True, deps=["a"])
+    m1.a = 2
+    assert m1.t == 20
+    m2 = m1.copy()  # shares the Computed object, with equal version counters
+    m2.a = 100
+    assert m2.t == 1000
+    assert m1.t == 20
+
+    class Model(modict):
+        _config = modict.config(override_computed=True)
+        a: int = 1
+
+        @modict.computed(cache=True, deps=["a"])
+        def t(self):
+            return self.a * 10
+
+    c = Model()
+    c.a = 2
+    assert c.t == 20
+    c2 = c.copy()
+    c2.a = 7
+    assert c2.t == 70
+    assert c.t == 20
+
+
 def test_version_exposed():
     assert isinstance(modict_pkg.__version__, str)
     assert modict_pkg.__version__ != ""
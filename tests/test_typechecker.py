@@ -29,6 +29,7 @@ import pytest
 
 from modict import (
     check_type,
+    compile_check,
     coerce,
     can_coerce,
     typechecked,
@@ -45,6 +46,32 @@ def test_check_type_success_and_failure():
         check_type(int, "not an int")
 
 
+@pytest.mark.parametrize(
+    "hint, good, bad",
+    [
+        (int, 1, True),
+        (Optional[str], None, 1),
+        (int | str, "a", 1.5),
+        (Literal["a", "b"], "b", "c"),
+        (list[int], [1, 2], [1, "2"]),
+        (dict[str, list[int]], {"a": [1]}, {"a": [1.0]}),
+        (set[int], {1}, {"1"}),
+        (tuple[int, str], (1, "a"), (1, "a", 2)),
+        (tuple[int, ...], (1, 2, 3), [1, 2]),
+        (MutableSequence[int], deque([1]), (1,)),
+        ("int", 1, "1"),
+    ],
+)
+def test_compile_check_matches_check_type(hint, good, bad):
+    check = compile_check(hint)
+    assert check(good) is True
+    assert check_type(hint, good) is True
+    with pytest.raises(TypeMismatchError):
+        check(bad)
+    with pytest.raises(TypeMismatchError):
+        check_type(hint, bad)
+
+
 def test_coerce_and_can_coerce():
     assert coerce("42", int) == 42
     assert coerce(("a", "b"), list[str]) == ["a", "b"]
@@ -70,6 +97,23 @@ def test_typechecked_decorator_checks_args_and_return():
         bad_return()
 
 
+def test_typechecked_decorator_keeps_full_signature():
+    @typechecked
+    def build(a: int, /, b: str = "x", *items: int, flag: bool = False, **extra: float) -> tuple:
+        return a, b, items, flag, extra
+
+    assert build(1) == (1, "x", (), False, {})
+    assert build(1, "y", 2, 3, flag=True, ratio=0.5) == (1, "y", (2, 3), True, {"ratio": 0.5})
+    assert build.__name__ == "build"
+
+    with pytest.raises(TypeMismatchError, match="'items'"):
+        build(1, "y", "not an int")
+    with pytest.raises(TypeMismatchError, match=r"'extra\[ratio\]'"):
+        build(1, ratio="high")
+    with pytest.raises(TypeError):
+        build(a=1)  # positional-only
+
+
 def test_check_type_union_optional_literal():
     assert check_type(Optional[int], 1)
     assert check_type(Optional[int], None)
@@ -163,6 +207,14 @@ def test_coerce_nested_collections_and_unions():
         coerce("abc", int)
 
 
+def test_coerce_follows_union_order_of_each_hint():
+    # Union[int, float] == Union[float, int]: cached dispatch must still try members in order
+    assert type(coerce("1", Union[int, float])) is int
+    assert type(coerce("1", Union[float, int])) is float
+    assert coerce(["1"], list[Union[float, int]]) == [1.0]
+    assert type(coerce(["1"], list[Union[int, float]])[0]) is int
+
+
 def test_can_coerce_with_mixed_iterables():
     assert can_coerce([1, 2, 3], list[str]) is True  # ints can become str
     assert can_coerce(["a", "b"], list[int]) is False